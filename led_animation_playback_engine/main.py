@@ -70,9 +70,7 @@ class LEDEngineApp:
             
         except Exception as e:
             if logger:
-                logger.error(f"Initialization failed: {e}")
-                import traceback
-                logger.error(f"Traceback: {traceback.format_exc()}")
+                logger.error(f"Initialization failed: {e}", exc_info=True)
             else:
                 print(f"FATAL ERROR: {e}", file=sys.stderr, flush=True)
             await self.cleanup()
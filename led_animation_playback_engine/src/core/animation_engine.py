@@ -10,7 +10,6 @@ import json
 from typing import List, Dict, Any, Optional, Callable
 from dataclasses import dataclass
 from collections import deque
-from pathlib import Path
 
 from .scene_manager import SceneManager
 from .led_output import LEDOutput
@@ -131,12 +130,6 @@ class AnimationEngine:
             error_message = None
             
             try:
-                file_path_obj = Path(file_path)
-                if not file_path_obj.exists():
-                    error_message = f"File not found: {file_path}"
-                    LoggingUtils.log_error("Animation", error_message)
-                    return
-                
                 success = self.scene_manager.load_multiple_scenes_from_file(file_path)
                 
                 if success:
@@ -144,7 +137,7 @@ class AnimationEngine:
                         self._stop_animation_loop()
                         LoggingUtils.log_info("Animation", "Stopped animation loop for new JSON data")
                     
-                    scenes_count = len(self.scene_manager.scenes) if hasattr(self.scene_manager, 'scenes') else None
+                    scenes_count = len(self.scene_manager.scenes)
                     LoggingUtils.log_info("Animation", f"Successfully loaded {scenes_count} scenes from {file_path}")
                     AnimationLogger.log_json_loaded("scenes", scenes_count)
                     self._notify_state_change()
@@ -176,7 +169,7 @@ class AnimationEngine:
                 scene_id = int(args[0])
                 LoggingUtils.log_info("Animation", f"Caching scene change to: {scene_id}")
                 
-                available_scenes = self.scene_manager.scenes.keys() if hasattr(self.scene_manager, 'scenes') else []
+                available_scenes = self.scene_manager.scenes.keys()
                 if not available_scenes:
                     error_message = "No scenes are loaded"
                     LoggingUtils.log_error("Animation", error_message)
@@ -307,10 +300,9 @@ class AnimationEngine:
                 current_scene = self.scene_manager.current_scene
                 if current_scene:
                     current_effect = current_scene.get_current_effect()
-                    if current_effect and hasattr(current_effect, 'segments'):
+                    if current_effect:
                         for segment in current_effect.segments.values():
-                            if hasattr(segment, 'pause_segment'):
-                                segment.pause_segment()
+                            segment.pause_segment()
                 
                 with self._lock:
                     self.stats.animation_running = False
@@ -332,10 +324,9 @@ class AnimationEngine:
                 current_scene = self.scene_manager.current_scene
                 if current_scene:
                     current_effect = current_scene.get_current_effect()
-                    if current_effect and hasattr(current_effect, 'segments'):
+                    if current_effect:
                         for segment in current_effect.segments.values():
-                            if hasattr(segment, 'resume_segment'):
-                                segment.resume_segment()
+                            segment.resume_segment()
                 
                 self.animation_paused = False
                 
@@ -467,6 +458,10 @@ class AnimationEngine:
                 LoggingUtils.log_warning("Animation", f"Color ID {color_id} invalid")
                 return False
             
+            if current_scene.palettes[palette_id][color_id] == validated_rgb:
+                LoggingUtils.log_debug("Animation", f"Palette {palette_id}[{color_id}] unchanged, skipping update")
+                return True
+            
             current_scene.palettes[palette_id][color_id] = validated_rgb
             
             LoggingUtils.log_info("Animation", f"Successfully updated palette {palette_id}[{color_id}] = RGB({validated_rgb[0]},{validated_rgb[1]},{validated_rgb[2]})")
@@ -566,9 +561,7 @@ class AnimationEngine:
             logger.info("Animation Engine started successfully")
             
         except Exception as e:
-            logger.error(f"Error starting engine: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error(f"Error starting engine: {e}", exc_info=True)
             raise
     
     def _start_animation_loop(self):
@@ -657,8 +650,7 @@ class AnimationEngine:
                     
                 except Exception as e:
                     logger.error(f"Error in animation loop frame: {e}")
-                    import traceback
-                    logger.error(f"Traceback: {traceback.format_exc()}")
+                    logger.debug("Animation frame traceback", exc_info=True)
                 
                 frame_time = time.perf_counter() - frame_start
                 sleep_time = max(0, self.frame_interval - frame_time)
@@ -676,9 +668,7 @@ class AnimationEngine:
                 self.fps_balancer.update_timing(frame_time, actual_sleep_time, actual_loop_time)
         
         except Exception as e:
-            logger.error(f"FATAL ERROR in dual pattern animation loop: {e}")
-            import traceback
-            logger.error(f"Animation loop traceback: {traceback.format_exc()}")
+            logger.error(f"FATAL ERROR in dual pattern animation loop: {e}", exc_info=True)
         finally:
             self.animation_running = False
             with self._lock:
@@ -702,8 +692,7 @@ class AnimationEngine:
                 
         except Exception as e:
             LoggingUtils.log_error("Animation", f"Error in _update_frame_with_dual_patterns: {e}")
-            import traceback
-            LoggingUtils.log_error("Animation", f"Traceback: {traceback.format_exc()}")
+            logger.debug("Frame update traceback", exc_info=True)
     
     def _check_scenes_available(self) -> bool:
         """Check if scenes are available for animation"""
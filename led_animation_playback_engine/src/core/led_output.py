@@ -3,11 +3,13 @@ LED Output
 High-performance LED data transmission via OSC
 """
 
-import struct
 import time
 import threading
+from itertools import chain
 from typing import List, Dict, Any, Optional
 from pythonosc import udp_client
+from pythonosc.osc_message import OscMessage
+from pythonosc.osc_message_builder import OscMessageBuilder
 from collections import deque
 
 from config.settings import EngineSettings
@@ -17,6 +19,13 @@ from src.utils.performance import ProfileTimer
 logger = ComponentLogger("LEDOutput")
 
 
+def build_led_message(address: str, data: bytes) -> OscMessage:
+    """Encode LED data as a single-blob OSC message"""
+    builder = OscMessageBuilder(address=address)
+    builder.add_arg(data)
+    return builder.build()
+
+
 class LEDDestination:
     """
     Individual LED output destination
@@ -52,12 +61,16 @@ class LEDDestination:
     
     def send_data(self, address: str, data: bytes) -> bool:
         """Send LED data to this destination"""
+        return self.send_built_message(build_led_message(address, data))
+    
+    def send_built_message(self, message: OscMessage) -> bool:
+        """Send an already encoded LED message to this destination"""
         if not self.enabled or not self.client:
             return False
         
         try:
             with self.performance_timer:
-                self.client.send_message(address, data)
+                self.client.send(message)
                 
             self.send_count += 1
             self.last_send_time = time.time()
@@ -240,19 +253,15 @@ class LEDOutput:
             if not led_colors:
                 return b""
             
-            binary_data = bytearray()
-            
-            for color in led_colors:
-                if len(color) >= 3:
-                    r = max(0, min(255, int(color[0])))
-                    g = max(0, min(255, int(color[1])))
-                    b = max(0, min(255, int(color[2])))
-                else:
-                    r = g = b = 0
-                
-                binary_data.extend(struct.pack("BBBB", r, g, b, 0))
-            
-            return bytes(binary_data)
+            return bytes(chain.from_iterable(
+                (
+                    max(0, min(255, int(color[0]))),
+                    max(0, min(255, int(color[1]))),
+                    max(0, min(255, int(color[2]))),
+                    0,
+                ) if len(color) >= 3 else (0, 0, 0, 0)
+                for color in led_colors
+            ))
             
         except Exception as e:
             logger.error(f"Error converting LED data to binary: {e}")
@@ -266,6 +275,7 @@ class LEDOutput:
         output_address = EngineSettings.OSC.output_address
         
         led_count = len(binary_data) // 4
+        full_message = None
         
         for destination in self.destinations:
             if not destination.enabled or not destination.client:
@@ -283,7 +293,14 @@ class LEDOutput:
                         dest_config.start_led, dest_config.end_led
                     )
             
-            if destination.send_data(output_address, data_to_send):
+            if data_to_send is binary_data:
+                if full_message is None:
+                    full_message = build_led_message(output_address, binary_data)
+                message = full_message
+            else:
+                message = build_led_message(output_address, data_to_send)
+            
+            if destination.send_built_message(message):
                 successful_sends += 1
         
         return successful_sends
@@ -3,11 +3,12 @@ OSC Handler - Zero-origin IDs and expanded palette format
 Handles incoming OSC messages with proper conversion between old and new formats
 """
 
-import re
 import asyncio
+import re
 import time
 import threading
-from typing import Dict, Callable, List, Any
+from functools import lru_cache
+from typing import Dict, Callable, List, Any, Pattern
 from pythonosc import dispatcher
 from pythonosc.osc_server import ThreadingOSCUDPServer
 from concurrent.futures import ThreadPoolExecutor
@@ -20,6 +21,74 @@ from src.utils.validation import ValidationUtils
 logger = get_logger(__name__)
 osc_logger = OSCLogger()
 
+PALETTE_PART_IDS = {
+    "A": 0, "B": 1, "C": 2, "D": 3, "E": 4,
+    "0": 0, "1": 1, "2": 2, "3": 3, "4": 4,
+}
+COLOR_SLOT_IDS = {"0": 0, "1": 1, "2": 2, "3": 3, "4": 4, "5": 5}
+OSC_PATTERN_CHARS = frozenset("*?[]{}")
+
+
+@lru_cache(maxsize=256)
+def _compile_address_pattern(address_pattern: str) -> Pattern:
+    """
+    Compile an incoming OSC address pattern once and reuse it for repeated messages
+    """
+    pattern = re.escape(address_pattern).replace("\\?", "\\w?").replace("\\*", "[\\w|\\+]*")
+    return re.compile(pattern)
+
+
+class OSCDispatcher(dispatcher.Dispatcher):
+    """
+    Dispatcher that compiles wildcard address regexes once at map time
+    instead of on every incoming message
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._wildcard_patterns: Dict[str, Pattern] = {}
+        self._address_order: Dict[str, int] = {}
+    
+    def map(self, address: str, handler: Callable, *args, needs_reply_address: bool = False):
+        self._address_order.setdefault(address, len(self._address_order))
+        if "*" in address and address not in self._wildcard_patterns:
+            self._wildcard_patterns[address] = re.compile(address.replace("*", "[^/]*?/*"))
+        return super().map(address, handler, *args, needs_reply_address=needs_reply_address)
+    
+    def handlers_for_address(self, address_pattern: str):
+        if not OSC_PATTERN_CHARS.intersection(address_pattern):
+            yield from self._handlers_for_exact_address(address_pattern)
+            return
+        
+        pattern_compiled = _compile_address_pattern(address_pattern)
+        matched = False
+        
+        for addr, handlers in self._map.items():
+            wildcard = self._wildcard_patterns.get(addr)
+            if pattern_compiled.fullmatch(addr) or (wildcard is not None and wildcard.match(address_pattern)):
+                yield from handlers
+                matched = True
+        
+        if not matched and self._default_handler:
+            yield self._default_handler
+    
+    def _handlers_for_exact_address(self, address: str):
+        """
+        Route a literal address by dict lookup, checking only wildcard mappings by regex
+        Matches are yielded in mapping order, as the stock dispatcher does
+        """
+        matched_addresses = [addr for addr, wildcard in self._wildcard_patterns.items() if wildcard.match(address)]
+        if address in self._map:
+            matched_addresses.append(address)
+            if len(matched_addresses) > 1:
+                matched_addresses.sort(key=self._address_order.__getitem__)
+        
+        for addr in matched_addresses:
+            yield from self._map[addr]
+        
+        if not matched_addresses and self._default_handler:
+            yield self._default_handler
+
 
 class OSCHandler:
     """
@@ -28,7 +97,7 @@ class OSCHandler:
     
     def __init__(self, engine):
         self.engine = engine
-        self.dispatcher = dispatcher.Dispatcher()
+        self.dispatcher = OSCDispatcher()
         self.server = None
         
         self.message_handlers: Dict[str, Callable] = {}
@@ -71,20 +140,26 @@ class OSCHandler:
     def _create_wrapper(self, address: str, handler: Callable):
         """
         Create a wrapper function for a handler with proper logging
+        The tracker operation name is built once for messages sent to the mapped address itself
         """
+        operation = f"handler_{address}"
+        
         def wrapper(osc_address: str, *args):
             try:
                 with self._lock:
                     self.message_count += 1
                     self.last_message_time = time.time()
                 
-                NewOSCLogger.log_received(osc_address, list(args))
+                NewOSCLogger.log_received(osc_address, args)
                 
                 if not ValidationUtils.validate_osc_address(osc_address):
                     NewOSCLogger.log_validation_failed(osc_address, "address", osc_address, "valid OSC address starting with /")
                     return
                 
-                future = self.executor.submit(self._safe_handler_call, handler, osc_address, *args)
+                future = self.executor.submit(
+                    self._safe_handler_call,
+                    handler, operation if osc_address == address else f"handler_{osc_address}", osc_address, *args
+                )
                 
             except Exception as e:
                 with self._lock:
@@ -93,12 +168,12 @@ class OSCHandler:
         
         return wrapper
     
-    def _safe_handler_call(self, handler: Callable, osc_address: str, *args):
+    def _safe_handler_call(self, handler: Callable, operation: str, osc_address: str, *args):
         """
         Call a handler safely with error handling
         """
         try:
-            with PerformanceTracker("OSC", f"handler_{osc_address}") as tracker:
+            with PerformanceTracker("OSC", operation) as tracker:
                 handler(osc_address, *args)
                 tracker.add_data("args_count", len(args))
                 NewOSCLogger.log_processed(osc_address, "success")
@@ -120,40 +195,40 @@ class OSCHandler:
                 self.message_count += 1
                 self.last_message_time = time.time()
             
-            NewOSCLogger.log_received(address, list(args))
+            NewOSCLogger.log_received(address, args)
             
-            match = re.match(r"/palette/([A-E0-4])/([0-5])", address)
-            if not match:
+            parts = address.split("/")
+            if len(parts) == 4 and not parts[0] and parts[1] == "palette":
+                palette_id = PALETTE_PART_IDS.get(parts[2])
+                color_id = COLOR_SLOT_IDS.get(parts[3])
+            else:
+                palette_id = color_id = None
+            if palette_id is None or color_id is None:
                 logger.error(f"Invalid palette address format: {address}")
                 return
             
-            palette_part, color_id_str = match.groups()
-            
-            if palette_part in ['A', 'B', 'C', 'D', 'E']:
-                palette_id = ord(palette_part) - ord('A')
-            else:
-                palette_id = int(palette_part) 
-            
-            color_id = int(color_id_str)
-            
             if len(args) < 3:
                 logger.error(f"Palette message requires at least 3 RGB arguments, got {len(args)}")
                 return
             
             try:
                 rgb = [int(args[i]) for i in range(3)]
-                original_rgb = rgb.copy()
+                original_rgb = None
                 
                 for i in range(3):
                     if rgb[i] < 0:
+                        if original_rgb is None:
+                            original_rgb = rgb.copy()
                         logger.warning(f"RGB[{i}] = {rgb[i]} < 0, adjusted to 0")
                         rgb[i] = 0
                     elif rgb[i] > 255:
+                        if original_rgb is None:
+                            original_rgb = rgb.copy()
                         logger.warning(f"RGB[{i}] = {rgb[i]} > 255, adjusted to 255")
                         rgb[i] = 255
                 
-                if original_rgb != rgb:
-                    logger.info(f"RGB values were adjusted: {original_rgb} -> {rgb}")
+                if original_rgb is not None:
+                    logger.info("RGB values were adjusted: %s -> %s", original_rgb, rgb)
                 
             except ValueError as ve:
                 logger.error(f"RGB values are not integers: {args[:3]} - {ve}")
@@ -167,7 +242,8 @@ class OSCHandler:
                 logger.error(f"Invalid Color ID {color_id} (must be 0-5)")
                 return
             
-            logger.info(f"Valid palette message: palette_id={palette_id}, color_id={color_id}, RGB=({rgb[0]},{rgb[1]},{rgb[2]})")
+            logger.debug("Valid palette message: palette_id=%s, color_id=%s, RGB=(%s,%s,%s)",
+                         palette_id, color_id, rgb[0], rgb[1], rgb[2])
             
             if self.palette_handler:
                 future = self.executor.submit(
@@ -193,7 +269,7 @@ class OSCHandler:
             handler(address, palette_id, color_id, rgb)
             
             process_time = time.time() - start_time
-            logger.info(f"Palette handler completed in {process_time:.3f}s")
+            logger.debug("Palette handler completed in %.3fs", process_time)
             
         except Exception as e:
             logger.error(f"Error in palette handler {address}: {e}")
@@ -6,7 +6,6 @@ Handles scene/effect/palette changes
 import json
 import time
 import threading
-from pathlib import Path
 from typing import Dict, List, Optional, Callable, Any
 
 from ..models.scene import Scene
@@ -243,7 +242,8 @@ class SceneManager:
         """
         try:
             with self._lock:
-                if scene_id not in self.scenes:
+                scene = self.scenes.get(scene_id)
+                if scene is None:
                     available_scenes = list(self.scenes.keys())
                     logger.warning(f"Scene {scene_id} not found. Available: {available_scenes}")
                     return False
@@ -255,7 +255,7 @@ class SceneManager:
                 old_scene_id = self.current_scene_id
                 
                 self.current_scene_id = scene_id
-                self.current_scene = self.scenes[scene_id]
+                self.current_scene = scene
                 
                 logger.info(f"Scene cached: {old_scene_id}→{scene_id} (waiting for change_pattern)")
                 
@@ -355,10 +355,10 @@ class SceneManager:
 
     def _store_original_speeds(self, scene_id: int):
         """Store original move speeds for a scene"""
-        if scene_id not in self.scenes:
+        scene = self.scenes.get(scene_id)
+        if scene is None:
             return
             
-        scene = self.scenes[scene_id]
         scene_speeds = {}
         
         for effect in scene.effects:
@@ -371,53 +371,53 @@ class SceneManager:
     
     def _apply_speed_to_current_effect(self, scene_id: int, speed_percent: int):
         """Apply speed percentage only to current effect (used for effect changes without dissolve)"""
-        if scene_id not in self.scenes or scene_id not in self.original_scene_speeds:
+        scene = self.scenes.get(scene_id)
+        original_speeds = self.original_scene_speeds.get(scene_id)
+        if scene is None or original_speeds is None:
             return
             
-        scene = self.scenes[scene_id]
-        original_speeds = self.original_scene_speeds[scene_id]
         speed_multiplier = speed_percent / 100.0
         
         current_effect = scene.get_current_effect()
         if current_effect:
-            effect_id_str = str(current_effect.effect_id)
-            if effect_id_str in original_speeds:
+            effect_speeds = original_speeds.get(str(current_effect.effect_id))
+            if effect_speeds is not None:
                 for segment_id, segment in current_effect.segments.items():
-                    if segment_id in original_speeds[effect_id_str]:
-                        original_speed = original_speeds[effect_id_str][segment_id]
+                    original_speed = effect_speeds.get(segment_id)
+                    if original_speed is not None:
                         segment.move_speed = original_speed * speed_multiplier
 
     def _apply_speed_to_scene(self, scene_id: int, speed_percent: int):
         """Apply speed percentage to specific scene segments (used for effect/palette changes)"""
-        if scene_id not in self.scenes or scene_id not in self.original_scene_speeds:
+        scene = self.scenes.get(scene_id)
+        original_speeds = self.original_scene_speeds.get(scene_id)
+        if scene is None or original_speeds is None:
             return
             
-        scene = self.scenes[scene_id]
-        original_speeds = self.original_scene_speeds[scene_id]
         speed_multiplier = speed_percent / 100.0
         
         for effect in scene.effects:
-            effect_id_str = str(effect.effect_id)
-            if effect_id_str in original_speeds:
+            effect_speeds = original_speeds.get(str(effect.effect_id))
+            if effect_speeds is not None:
                 for segment_id, segment in effect.segments.items():
-                    if segment_id in original_speeds[effect_id_str]:
-                        original_speed = original_speeds[effect_id_str][segment_id]
+                    original_speed = effect_speeds.get(segment_id)
+                    if original_speed is not None:
                         segment.move_speed = original_speed * speed_multiplier
 
     def _restore_original_speeds(self, scene_id: int):
         """Restore original move speeds for a scene (used for scene changes)"""
-        if scene_id not in self.scenes or scene_id not in self.original_scene_speeds:
+        scene = self.scenes.get(scene_id)
+        original_speeds = self.original_scene_speeds.get(scene_id)
+        if scene is None or original_speeds is None:
             return
             
-        scene = self.scenes[scene_id]
-        original_speeds = self.original_scene_speeds[scene_id]
         
         for effect in scene.effects:
-            effect_id_str = str(effect.effect_id)
-            if effect_id_str in original_speeds:
+            effect_speeds = original_speeds.get(str(effect.effect_id))
+            if effect_speeds is not None:
                 for segment_id, segment in effect.segments.items():
-                    if segment_id in original_speeds[effect_id_str]:
-                        original_speed = original_speeds[effect_id_str][segment_id]
+                    original_speed = effect_speeds.get(segment_id)
+                    if original_speed is not None:
                         segment.move_speed = original_speed
 
     # ==================== JSON Loading ====================
@@ -426,14 +426,13 @@ class SceneManager:
         """Load multiple scenes from JSON file with 'scenes' array"""
         try:
             with self._lock:
-                file_path_obj = Path(file_path)
-                if not file_path_obj.exists():
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except FileNotFoundError:
                     logger.error(f"Scene file not found: {file_path}")
                     return False
                 
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
                 if "scenes" not in data:
                     logger.error("Invalid JSON format: missing 'scenes' array")
                     return False
@@ -467,7 +466,7 @@ class SceneManager:
                 
                 if scenes_loaded > 0:
                     if self.current_scene_id is None:
-                        first_scene_id = min(self.scenes.keys())
+                        first_scene_id = min(self.scenes)
                         self.current_scene_id = first_scene_id
                         self.current_scene = self.scenes[first_scene_id]
                         
@@ -542,9 +541,9 @@ class SceneManager:
                 if self.dissolve_transition.is_active:
                     updated_effects = set() 
                     
-                    if (self.dissolve_transition.old_pattern and 
-                        self.dissolve_transition.old_pattern.scene_id in self.scenes):
-                        old_scene = self.scenes[self.dissolve_transition.old_pattern.scene_id]
+                    old_scene = (self.scenes.get(self.dissolve_transition.old_pattern.scene_id)
+                                 if self.dissolve_transition.old_pattern else None)
+                    if old_scene is not None:
                         if self.dissolve_transition.old_pattern.effect_id < len(old_scene.effects):
                             old_effect = old_scene.effects[self.dissolve_transition.old_pattern.effect_id]
                             effect_key = (self.dissolve_transition.old_pattern.scene_id, self.dissolve_transition.old_pattern.effect_id)
@@ -552,9 +551,9 @@ class SceneManager:
                                 old_effect.update_animation(original_delta)
                                 updated_effects.add(effect_key)
                     
-                    if (self.dissolve_transition.new_pattern and 
-                        self.dissolve_transition.new_pattern.scene_id in self.scenes):
-                        new_scene = self.scenes[self.dissolve_transition.new_pattern.scene_id]
+                    new_scene = (self.scenes.get(self.dissolve_transition.new_pattern.scene_id)
+                                 if self.dissolve_transition.new_pattern else None)
+                    if new_scene is not None:
                         if self.dissolve_transition.new_pattern.effect_id < len(new_scene.effects):
                             new_effect = new_scene.effects[self.dissolve_transition.new_pattern.effect_id]
                             effect_key = (self.dissolve_transition.new_pattern.scene_id, self.dissolve_transition.new_pattern.effect_id)
@@ -568,8 +567,8 @@ class SceneManager:
                         scene_id = self.cached_scene_id
                         effect_id = self.cached_effect_id if self.cached_effect_id is not None else 0
                         
-                        if scene_id in self.scenes:
-                            cached_scene = self.scenes[scene_id]
+                        cached_scene = self.scenes.get(scene_id)
+                        if cached_scene is not None:
                             if effect_id < len(cached_scene.effects):
                                 cached_scene.effects[effect_id].update_animation(original_delta)
                     else:
@@ -601,8 +600,8 @@ class SceneManager:
                         effect_id = self.cached_effect_id if self.cached_effect_id is not None else 0
                         palette_id = self.cached_palette_id if self.cached_palette_id is not None else 0
                        
-                        if scene_id in self.scenes:
-                            cached_scene = self.scenes[scene_id]
+                        cached_scene = self.scenes.get(scene_id)
+                        if cached_scene is not None:
                             if effect_id < len(cached_scene.effects):
                                 effect = cached_scene.effects[effect_id]
                                 
@@ -87,11 +87,10 @@ class DualPatternCalculator:
         """
         try:
             with self._lock:
-                if pattern_state.scene_id not in self.scene_manager.scenes:
+                scene = self.scene_manager.scenes.get(pattern_state.scene_id)
+                if scene is None:
                     return [[0, 0, 0] for _ in range(led_count)]
                 
-                scene = self.scene_manager.scenes[pattern_state.scene_id]
-                
                 if pattern_state.effect_id >= len(scene.effects):
                     return [[0, 0, 0] for _ in range(led_count)]
                 
@@ -2,8 +2,9 @@
 Effect model -  tructure with zero-origin IDs
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
+import sys
 import time
 from src.utils.color_utils import ColorUtils
 from .segment import Segment
@@ -18,12 +19,24 @@ class Effect:
     
     effect_id: int
     segments: Dict[str, Segment] = field(default_factory=dict)
+    _render_order: Optional[List[Segment]] = field(default=None, init=False, repr=False, compare=False)
     
     def add_segment(self, segment: Segment):
         """
         Add a segment to the effect
         """
         self.segments[str(segment.segment_id)] = segment
+        self._render_order = None
+        
+    def _get_render_order(self) -> List[Segment]:
+        """
+        Get segments sorted by ID, rebuilt only when the segment set changes
+        """
+        order = self._render_order
+        if order is None or len(order) != len(self.segments):
+            order = sorted(self.segments.values(), key=lambda seg: seg.segment_id)
+            self._render_order = order
+        return order
         
     def update_animation(self, delta_time: float):
         """
@@ -42,9 +55,7 @@ class Effect:
         for led in led_array:
             led[0] = led[1] = led[2] = 0
         
-        sorted_segments = sorted(self.segments.values(), key=lambda seg: seg.segment_id)
-        
-        for segment in sorted_segments:
+        for segment in self._get_render_order():
             segment.render_to_led_array(palette, current_time, led_array)
         
         ColorUtils.finalize_frame_blending(led_array)
@@ -94,7 +105,6 @@ class Effect:
             return effect
             
         except Exception as e:
-            import sys
             print(f"Error creating effect from dict: {e}", file=sys.stderr, flush=True)
             return cls(effect_id=0)
     
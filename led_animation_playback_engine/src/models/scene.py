@@ -4,6 +4,7 @@ Scene model - Zero-origin IDs with led_count and fpse
 
 from typing import List, Any, Dict, Optional
 from dataclasses import dataclass, field
+import sys
 import time
 
 from .effect import Effect
@@ -182,40 +183,36 @@ class Scene:
             palettes_data = data.get("palettes", {})
             if isinstance(palettes_data, dict):
                 max_id = 0
-                for key in palettes_data.keys():
+                palettes_by_id = {}
+                for key, palette in palettes_data.items():
                     if isinstance(key, str):
                         palette_id = ord(key.upper()) - ord('A')
                     else:
                         palette_id = int(key)
                     max_id = max(max_id, palette_id)
+                    palettes_by_id[palette_id] = palette
                 
-                scene.palettes = [[[255, 255, 255]] * 6 for _ in range(max_id + 1)]
-                
-                for key, palette in palettes_data.items():
-                    if isinstance(key, str):
-                        palette_id = ord(key.upper()) - ord('A')
-                    else:
-                        palette_id = int(key)
-                    
-                    if 0 <= palette_id < len(scene.palettes):
-                        scene.palettes[palette_id] = palette
+                scene.palettes = [
+                    palettes_by_id[i] if i in palettes_by_id else [[255, 255, 255]] * 6
+                    for i in range(max_id + 1)
+                ]
             else:
                 scene.palettes = palettes_data or [[[255, 255, 255]] * 6]
             
             effects_data = data.get("effects", {})
             if isinstance(effects_data, dict):
                 max_id = 0
-                for key in effects_data.keys():
+                effects_by_id = {}
+                for key, effect_data in effects_data.items():
                     effect_id = int(key)
                     max_id = max(max_id, effect_id)
+                    if effect_id >= 0:
+                        effects_by_id[effect_id] = effect_data
                 
-                scene.effects = [Effect(effect_id=i) for i in range(max_id + 1)]
-                
-                for key, effect_data in effects_data.items():
-                    effect_id = int(key)
-                    if 0 <= effect_id < len(scene.effects):
-                        effect = Effect.from_dict(effect_data)
-                        scene.effects[effect_id] = effect
+                scene.effects = [
+                    Effect.from_dict(effects_by_id[i]) if i in effects_by_id else Effect(effect_id=i)
+                    for i in range(max_id + 1)
+                ]
             else:
                 if isinstance(effects_data, list):
                     scene.effects = []
@@ -228,7 +225,6 @@ class Scene:
             return scene
             
         except Exception as e:
-            import sys
             print(f"Error creating scene from dict: {e}", file=sys.stderr, flush=True)
             return cls(scene_id=0)
     
@@ -5,6 +5,7 @@ Zero-origin IDs with stable brightness calculations and boundary checking
 
 from typing import List, Any, Dict, Optional
 from dataclasses import dataclass, field
+import sys
 import time
 import math
 
@@ -106,7 +107,7 @@ class Segment:
         if not self.dimmer_time or len(self.dimmer_time) == 0:
             return 1.0
         
-        if not hasattr(self, 'segment_start_time') or self.segment_start_time is None:
+        if self.segment_start_time is None:
             self.segment_start_time = current_time
         
         if self.is_paused and self.pause_start_time is not None:
@@ -140,10 +141,7 @@ class Segment:
         if self.is_paused or abs(self.move_speed) < 0.001:
             return
         
-        if not hasattr(self, '_fractional_accumulator'):
-            self._fractional_accumulator = 0.0
-        
-        if not hasattr(self, '_position_initialized') or not self._position_initialized:
+        if not self._position_initialized:
             self.current_position = int(self.initial_position)
             self._position_initialized = True
             self._fractional_accumulator = 0.0
@@ -206,6 +204,7 @@ class Segment:
                 return []
             
             colors = []
+            palette_colors = [ColorUtils.get_palette_color(palette, index) for index in self.color]
             
             for part_index in range(len(self.length)):
                 part_length = self.length[part_index] if part_index < len(self.length) else 0
@@ -213,23 +212,21 @@ class Segment:
                 if part_length <= 0:
                     continue
                 
-                color_index = self.color[part_index] if part_index < len(self.color) else 0
+                base_color = palette_colors[part_index] if part_index < len(palette_colors) else ColorUtils.get_palette_color(palette, 0)
                 transparency = self.transparency[part_index] if part_index < len(self.transparency) else 0.0
                 
-                next_color_index = None
+                next_color = None
                 next_transparency = None
                 
                 if part_index + 1 < len(self.color):
-                    next_color_index = self.color[part_index + 1]
+                    next_color = palette_colors[part_index + 1]
                     next_transparency = self.transparency[part_index + 1] if part_index + 1 < len(self.transparency) else 0.0
                 
                 for led_in_part in range(part_length):
-                    if next_color_index is not None and next_transparency is not None and part_length > 1:
+                    if next_color is not None and next_transparency is not None and part_length > 1:
                         progress = led_in_part / (part_length - 1) if part_length > 1 else 0.0
                         
-                        base_color1 = ColorUtils.get_palette_color(palette, color_index)
-                        base_color2 = ColorUtils.get_palette_color(palette, next_color_index)
-                        interpolated_color = ColorUtils.interpolate_color(base_color1, base_color2, progress)
+                        interpolated_color = ColorUtils.interpolate_color(base_color, next_color, progress)
                         
                         interpolated_transparency = ColorUtils.interpolate_transparency(transparency, next_transparency, progress)
                         
@@ -237,7 +234,6 @@ class Segment:
                             interpolated_color, interpolated_transparency, brightness_factor
                         )
                     else:
-                        base_color = ColorUtils.get_palette_color(palette, color_index)
                         final_color = ColorUtils.calculate_segment_color(
                             base_color, transparency, brightness_factor
                         )
@@ -246,12 +242,10 @@ class Segment:
             
             if len(self.color) > len(self.length):
                 for extra_index in range(len(self.length), len(self.color)):
-                    color_index = self.color[extra_index]
                     transparency = self.transparency[extra_index] if extra_index < len(self.transparency) else 0.0
                     
-                    base_color = ColorUtils.get_palette_color(palette, color_index)
                     final_color = ColorUtils.calculate_segment_color(
-                        base_color, transparency, brightness_factor
+                        palette_colors[extra_index], transparency, brightness_factor
                     )
                     colors.append(final_color)
             
@@ -267,6 +261,11 @@ class Segment:
         if not segment_colors:
             return
         
+        validate_color = ColorUtils.validate_rgb_color
+        add_layer = ColorUtils.add_segment_layer
+        transparency_for = self.get_transparency_for_led_index
+        segment_id = self.segment_id
+        
         try:
             base_position = int(self.current_position)
             
@@ -284,9 +283,9 @@ class Segment:
                     final_led_index = base_position + led_index
                     
                     if 0 <= final_led_index < len(led_array):
-                        validated_color = ColorUtils.validate_rgb_color(segment_colors[led_index])
-                        segment_transparency = self.get_transparency_for_led_index(led_index)
-                        ColorUtils.add_segment_layer(final_led_index, validated_color, self.segment_id, segment_transparency)
+                        validated_color = validate_color(segment_colors[led_index])
+                        segment_transparency = transparency_for(led_index)
+                        add_layer(final_led_index, validated_color, segment_id, segment_transparency)
                 return
             
             max_allowed_position = self.move_range[1] - len(segment_colors) + 1 if len(self.move_range) >= 2 else len(led_array) - len(segment_colors)
@@ -304,9 +303,9 @@ class Segment:
                 final_led_index = safe_position + led_index
                 
                 if 0 <= final_led_index < len(led_array):
-                    validated_color = ColorUtils.validate_rgb_color(segment_colors[led_index])
-                    segment_transparency = self.get_transparency_for_led_index(led_index)
-                    ColorUtils.add_segment_layer(final_led_index, validated_color, self.segment_id, segment_transparency)
+                    validated_color = validate_color(segment_colors[led_index])
+                    segment_transparency = transparency_for(led_index)
+                    add_layer(final_led_index, validated_color, segment_id, segment_transparency)
                     
         except Exception:
             pass
@@ -376,7 +375,6 @@ class Segment:
             return segment
             
         except Exception as e:
-            import sys
             print(f"Error creating segment from dict: {e}", file=sys.stderr, flush=True)
             return cls(segment_id=0)
     
@@ -400,8 +398,7 @@ class Segment:
         """Reset the position to the initial position and restart timing"""
         self.current_position = int(self.initial_position)
         self.reset_animation_timing()
-        if hasattr(self, '_fractional_accumulator'):
-            self._fractional_accumulator = 0.0
+        self._fractional_accumulator = 0.0
 
     def is_active(self) -> bool:
         """Check if the segment is active"""
@@ -46,7 +46,7 @@ class ColorUtils:
     def finalize_frame_blending(led_array):
         for led_index, contributions in ColorUtils._led_contributions.items():
             if led_index < len(led_array):
-                if contributions and isinstance(contributions[0], dict):
+                if contributions and type(contributions[0]) is dict:
                     layers = sorted(contributions, key=lambda x: x['segment_id'])
                     
                     final_color = [0, 0, 0]
@@ -130,14 +130,16 @@ class ColorUtils:
     def calculate_segment_color(base_color, transparency, brightness_factor):
         opacity = 1.0 - max(0.0, min(1.0, transparency))
         
-        final_color = [
-            int(base_color[0] * opacity * brightness_factor),
-            int(base_color[1] * opacity * brightness_factor),
-            int(base_color[2] * opacity * brightness_factor)
+        r = int(base_color[0] * opacity * brightness_factor)
+        g = int(base_color[1] * opacity * brightness_factor)
+        b = int(base_color[2] * opacity * brightness_factor)
+        
+        return [
+            r if 0 <= r <= 255 else (0 if r < 0 else 255),
+            g if 0 <= g <= 255 else (0 if g < 0 else 255),
+            b if 0 <= b <= 255 else (0 if b < 0 else 255)
         ]
     
-        return [max(0, min(255, c)) for c in final_color]
-    
     @staticmethod
     def get_palette_color(palette, color_index):
         if not palette or len(palette) == 0:
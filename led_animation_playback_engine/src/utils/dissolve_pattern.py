@@ -5,7 +5,6 @@ Handles loading and managing dissolve patterns from JSON files
 
 from typing import List, Dict, Any, Optional
 import json
-from pathlib import Path
 
 from src.utils.logger import ComponentLogger
 
@@ -33,14 +32,13 @@ class DissolvePatternManager:
             bool: True if patterns loaded successfully
         """
         try:
-            file_path_obj = Path(file_path)
-            if not file_path_obj.exists():
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except FileNotFoundError:
                 logger.error(f"Dissolve pattern file not found: {file_path}")
                 return False
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
             if 'dissolve_patterns' not in data:
                 logger.error(f"Invalid JSON: missing 'dissolve_patterns' key in {file_path}")
                 return False
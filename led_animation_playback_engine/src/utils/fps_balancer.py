@@ -25,6 +25,7 @@ class FPSBalancer:
     
     def __init__(self, animation_engine=None):
         self.animation_engine = animation_engine
+        self._engine_set_target_fps = getattr(animation_engine, 'set_target_fps', None)
         self.config = EngineSettings.FPS_BALANCER
         
         self.desired_fps = EngineSettings.ANIMATION.target_fps
@@ -139,8 +140,8 @@ class FPSBalancer:
             self.current_target_fps = max(self.min_fps, min(self.max_fps, new_target))
             self.last_adjustment_time = time.time()
             
-            if self.animation_engine and hasattr(self.animation_engine, 'set_target_fps'):
-                self.animation_engine.set_target_fps(self.current_target_fps, propagate_to_balancer=False)
+            if self._engine_set_target_fps is not None:
+                self._engine_set_target_fps(self.current_target_fps, propagate_to_balancer=False)
             
             led_count = self.led_count_history[-1] if self.led_count_history else 0
             avg_processing = sum(list(self.processing_times)[-3:]) / min(3, len(self.processing_times)) if self.processing_times else 0.0
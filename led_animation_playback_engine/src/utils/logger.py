@@ -16,6 +16,8 @@ from config.settings import EngineSettings
 
 colorama.init(autoreset=True)
 
+_ensured_log_dirs = set()
+
 
 class LoggerMode:
     """
@@ -63,15 +65,33 @@ class ColoredFormatter(logging.Formatter):
         'PerformanceMonitor': Fore.WHITE,
     }
     
+    _level_labels = {}
+    _component_labels = {}
+    
+    @classmethod
+    def _level_label(cls, levelname: str) -> str:
+        """Get the colored level label, building it once per level name"""
+        label = cls._level_labels.get(levelname)
+        if label is None:
+            level_color = cls.COLORS.get(levelname, '')
+            label = cls._level_labels[levelname] = f"{level_color}{levelname:<8}{Style.RESET_ALL}"
+        return label
+    
+    @classmethod
+    def _component_label(cls, name: str) -> str:
+        """Get the colored component label, building it once per logger name"""
+        label = cls._component_labels.get(name)
+        if label is None:
+            component = name.split('.')[-1]
+            component_color = cls.COMPONENT_COLORS.get(component, Fore.BLUE)
+            label = cls._component_labels[name] = f"{component_color}{component:<15}{Style.RESET_ALL}"
+        return label
+    
     def format(self, record):
         """Format log record with colors and structure"""
         if LoggerMode.is_terminal() and sys.stdout.isatty():
-            level_color = self.COLORS.get(record.levelname, '')
-            record.levelname = f"{level_color}{record.levelname:<8}{Style.RESET_ALL}"
-            
-            component = record.name.split('.')[-1]
-            component_color = self.COMPONENT_COLORS.get(component, Fore.BLUE)
-            record.name = f"{component_color}{component:<15}{Style.RESET_ALL}"
+            record.levelname = self._level_label(record.levelname)
+            record.name = self._component_label(record.name)
             
             if record.levelname.strip() in ['ERROR', 'CRITICAL']:
                 record.msg = f"{Fore.RED}{record.msg}{Style.RESET_ALL}"
@@ -182,7 +202,9 @@ def setup_logger(name: str) -> logging.Logger:
     if EngineSettings.LOGGING.file_output:
         try:
             log_dir = Path(EngineSettings.LOGGING.log_directory)
-            log_dir.mkdir(parents=True, exist_ok=True)
+            if log_dir not in _ensured_log_dirs:
+                log_dir.mkdir(parents=True, exist_ok=True)
+                _ensured_log_dirs.add(log_dir)
             
             log_file = log_dir / "led_engine.log"
             
@@ -4,7 +4,8 @@ Eliminates duplicate logging code and provides consistent logging format
 """
 
 import time
-from typing import Any, Dict, Optional
+import logging
+from typing import Any, Dict, Optional, Sequence
 from enum import Enum
 from .logger import setup_logger
 
@@ -95,26 +96,30 @@ class OSCLogger:
         return setup_logger("OSC")
     
     @staticmethod
-    def log_received(address: str, args: list, extra_data: Dict = None):
-        """Log OSC message received"""
+    def log_received(address: str, args: Sequence, extra_data: Dict = None):
+        """Log OSC message received (debug level, skipped entirely when filtered)"""
         logger = OSCLogger._get_logger()
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         message = f"Received OSC: {address}"
         if args:
-            message += f" with args: {args}"
+            message += f" with args: {list(args)}"
         if extra_data:
             extra_str = ", ".join(f"{k}={v}" for k, v in extra_data.items())
             message += f" ({extra_str})"
-        logger.info(message)
+        logger.debug(message)
     
     @staticmethod
     def log_processed(address: str, result: str, duration_ms: float = None):
-        """Log OSC message processed"""
+        """Log OSC message processed (debug level, skipped entirely when filtered)"""
         logger = OSCLogger._get_logger()
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         message = f"Processed {address} (result={result}"
         if duration_ms is not None:
             message += f", duration_ms={duration_ms:.2f}"
         message += ")"
-        logger.info(message)
+        logger.debug(message)
     
     @staticmethod
     def log_error(address: str, error_msg: str, args: list = None):
@@ -175,9 +175,10 @@ class ProfilerManager:
         Get or create timer
         """
         with self._lock:
-            if name not in self.timers:
-                self.timers[name] = ProfileTimer(name)
-            return self.timers[name]
+            timer = self.timers.get(name)
+            if timer is None:
+                timer = self.timers[name] = ProfileTimer(name)
+            return timer
     
     def profile(self, name: str):
         """
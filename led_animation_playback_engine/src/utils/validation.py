@@ -3,6 +3,7 @@ Centralized validation utilities for LED Animation Engine
 Eliminates duplicate validation code and provides consistent error handling
 """
 
+import re
 from typing import Any, List, Union, Tuple, Optional, Dict
 from .logger import setup_logger
 
@@ -12,6 +13,8 @@ try:
 except ImportError:
     settings = None
 
+OSC_ADDRESS_PATTERN = re.compile(r"/[\w/-]+")
+
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
@@ -177,9 +180,9 @@ class ValidationUtils:
     @staticmethod
     def validate_osc_address(address: str) -> bool:
         """Validate OSC address format"""
-        if not isinstance(address, str) or not address.startswith('/'):
+        if not isinstance(address, str):
             return False
-        return len(address) > 1 and all(c.isalnum() or c in '/_-' for c in address[1:])
+        return OSC_ADDRESS_PATTERN.fullmatch(address) is not None
     
     @staticmethod
     def validate_json_structure(data: Dict, required_keys: List[str]) -> bool:
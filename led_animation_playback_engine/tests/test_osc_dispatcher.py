@@ -0,0 +1,73 @@
+import os
+import random
+import sys
+
+import pytest
+from pythonosc.dispatcher import Dispatcher
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.osc_handler import OSCDispatcher
+
+MAPPED_ADDRESSES = [
+    "/a/*",
+    "/a/b",
+    "/a/b/c",
+    "/*/b",
+    "/a/*/c",
+    "/load_json",
+    "/change_scene",
+    "/scene/*/effect",
+    "/scene/1/effect",
+]
+
+INCOMING_ADDRESSES = [
+    "/a/b",
+    "/a/b/c",
+    "/a/z/c",
+    "/load_json",
+    "/change_scene",
+    "/scene/1/effect",
+    "/scene/2/effect",
+    "/load_*",
+    "/a/*",
+    "/scene/*/effect",
+    "/a/?",
+    "/change_scen?",
+    "/unmapped",
+    "/a/b/c/d",
+]
+
+
+def build(dispatcher_class, addresses):
+    dispatcher = dispatcher_class()
+    dispatcher.set_default_handler(print)
+    for address in addresses:
+        dispatcher.map(address, print, address)
+    return dispatcher
+
+
+def routed(dispatcher, address):
+    return [handler.args[0] if handler.args else "default" for handler in dispatcher.handlers_for_address(address)]
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_routing_matches_stock_dispatcher_for_shuffled_mappings(seed):
+    rng = random.Random(seed)
+    addresses = rng.sample(MAPPED_ADDRESSES, rng.randint(1, len(MAPPED_ADDRESSES)))
+    stock = build(Dispatcher, addresses)
+    engine = build(OSCDispatcher, addresses)
+
+    for address in INCOMING_ADDRESSES:
+        assert routed(engine, address) == routed(stock, address), address
+
+
+def test_wildcard_mapping_precedes_later_literal_mapping():
+    engine = build(OSCDispatcher, ["/a/*", "/a/b"])
+    assert routed(engine, "/a/b") == ["/a/*", "/a/b"]
+
+
+def test_unmatched_address_falls_back_to_default_handler():
+    engine = build(OSCDispatcher, ["/a/b", "/a/*"])
+    assert routed(engine, "/unmapped") == ["default"]
+    assert routed(engine, "/x/?") == ["default"]
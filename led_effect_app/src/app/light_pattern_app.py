@@ -1,4 +1,5 @@
 import flet as ft
+import asyncio
 import os
 from components.panel import SceneEffectPanel, SegmentEditPanel
 from components.data import DataActionHandler
@@ -32,7 +33,6 @@ class LightPatternApp(ft.Container):
   
     async def _delayed_register_panels_task(self):
         """Delayed panel registration to ensure components are ready"""
-        import asyncio
         await asyncio.sleep(0.3) 
         
         try:
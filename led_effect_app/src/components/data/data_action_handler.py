@@ -1,4 +1,5 @@
 import flet as ft
+import asyncio
 from typing import Dict, Any, Optional
 from services.data_cache import data_cache
 from services.color_service import color_service
@@ -16,6 +17,7 @@ class DataActionHandler:
         self.toast_manager = ToastManager(page)
         self.scene_effect_panel = None
         self.segment_edit_panel = None
+        self._cache_update_pending = False
         data_cache.add_change_listener(self._on_cache_changed)
         
         self._initialize_ui_with_cache_data()
@@ -37,7 +39,6 @@ class DataActionHandler:
         
     async def _delayed_update_task(self):
         """Delayed update task to ensure components are ready"""
-        import asyncio
         await asyncio.sleep(0.2)
         
         try:
@@ -302,17 +303,21 @@ class DataActionHandler:
             AppLogger.error(f"Error updating color service: {e}")
             
     def _on_cache_changed(self):
-        """Handle cache change events"""
+        """Handle cache change events, coalescing bursts into one pending UI update"""
+        if self._cache_update_pending:
+            return
         try:
+            self._cache_update_pending = True
             self.page.run_task(self._delayed_cache_update_task)
         except Exception as e:
+            self._cache_update_pending = False
             self.toast_manager.show_error_sync(f"Error handling cache change")
             AppLogger.error(f"Error handling cache change: {e}")
             
     async def _delayed_cache_update_task(self):
         """Delayed cache update task"""
-        import asyncio
         await asyncio.sleep(0.1)
+        self._cache_update_pending = False
         
         try:
             self.update_all_ui_from_cache()
@@ -214,6 +214,7 @@ class ToastManager:
         self.page = page
         self.active_toasts = []
         self.toast_spacing = 70 
+        self._scheduled_toasts = set()
         
     def _calculate_toast_position(self, toast: Toast):
         """Calculate position for new toast to avoid overlapping (bottom-left stacking)"""
@@ -288,17 +289,33 @@ class ToastManager:
             hasattr(self.page, 'update')
         )
         
+    def _schedule_toast(self, toast_type: str, message: str, duration: int, show):
+        """Run a toast task unless an identical toast is already scheduled or visible"""
+        key = (toast_type, message)
+        if key in self._scheduled_toasts:
+            return
+        self._scheduled_toasts.add(key)
+        
+        async def _show():
+            try:
+                await show(message, duration)
+            finally:
+                self._scheduled_toasts.discard(key)
+        
+        try:
+            self.page.run_task(_show)
+        except Exception:
+            self._scheduled_toasts.discard(key)
+            raise
+        
     def show_success_sync(self, message: str, duration: int = 3000):
         """Show success toast synchronously"""
         if not self._is_page_valid():
             print(f"Warning: Cannot show success toast - {message}")
             return
             
-        async def _show():
-            await self.show_success(message, duration)
-        
         try:
-            self.page.run_task(_show)
+            self._schedule_toast("success", message, duration, self.show_success)
         except Exception as e:
             print(f"Error showing success toast: {e}")
         
@@ -308,11 +325,8 @@ class ToastManager:
             print(f"Warning: Cannot show error toast - {message}")
             return
             
-        async def _show():
-            await self.show_error(message, duration)
-        
         try:
-            self.page.run_task(_show)
+            self._schedule_toast("error", message, duration, self.show_error)
         except Exception as e:
             print(f"Error showing error toast: {e}")
         
@@ -322,11 +336,8 @@ class ToastManager:
             print(f"Warning: Cannot show warning toast - {message}")
             return
             
-        async def _show():
-            await self.show_warning(message, duration)
-        
         try:
-            self.page.run_task(_show)
+            self._schedule_toast("warning", message, duration, self.show_warning)
         except Exception as e:
             print(f"Error showing warning toast: {e}")
         
@@ -336,10 +347,7 @@ class ToastManager:
             print(f"Warning: Cannot show info toast - {message}")
             return
             
-        async def _show():
-            await self.show_info(message, duration)
-        
         try:
-            self.page.run_task(_show)
+            self._schedule_toast("info", message, duration, self.show_info)
         except Exception as e:
             print(f"Error showing info toast: {e}")
\ No newline at end of file
@@ -13,6 +13,7 @@ class Scene:
     current_palette_id: int
     palettes: List[List[List[int]]] = field(default_factory=list)
     effects: List['Effect'] = field(default_factory=list)
+    _effects_by_id: Optional[Dict[int, 'Effect']] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate scene data after initialization"""
@@ -26,8 +27,6 @@ class Scene:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Scene':
         """Create Scene from dictionary"""
-        from models.effect import Effect
-        
         scene = cls(
             scene_id=data['scene_id'],
             led_count=data['led_count'],
@@ -55,11 +54,14 @@ class Scene:
         }
         
     def get_effect(self, effect_id: int) -> Optional['Effect']:
-        """Get effect by ID"""
-        for effect in self.effects:
-            if effect.effect_id == effect_id:
-                return effect
-        return None
+        """Get effect by ID (index rebuilt after effects are added or removed)"""
+        index = self._effects_by_id
+        if index is None or len(index) != len(self.effects):
+            index = {}
+            for effect in self.effects:
+                index.setdefault(effect.effect_id, effect)
+            self._effects_by_id = index
+        return index.get(effect_id)
         
     def get_effect_ids(self) -> List[int]:
         """Get all effect IDs in this scene"""
@@ -79,11 +81,13 @@ class Scene:
     def add_effect(self, effect: 'Effect'):
         """Add effect to scene"""
         self.effects.append(effect)
+        self._effects_by_id = None
         
     def remove_effect(self, effect_id: int) -> bool:
         """Remove effect by ID"""
         for i, effect in enumerate(self.effects):
             if effect.effect_id == effect_id:
                 del self.effects[i]
+                self._effects_by_id = None
                 return True
         return False
\ No newline at end of file
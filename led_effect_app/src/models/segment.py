@@ -48,6 +48,23 @@ class Segment:
 
         self.length = [value if value > 0 else 10 for value in self.length]
             
+    @classmethod
+    def create_default(cls, segment_id: int = 0, move_range_end: int = 250) -> 'Segment':
+        """Create default segment with six palette colors and a fade in/out dimmer"""
+        return cls(
+            segment_id=segment_id,
+            color=[0, 1, 2, 3, 4, 5],
+            transparency=[1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
+            length=[10, 10, 10, 10, 10],
+            move_speed=100.0,
+            move_range=[0, move_range_end],
+            initial_position=0,
+            current_position=0.0,
+            is_edge_reflect=True,
+            region_id=0,
+            dimmer_time=[[1000, 0, 100], [1000, 100, 0]]
+        )
+        
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Segment':
         """Create Segment from dictionary"""
@@ -52,6 +52,8 @@ class ColorService:
         """Update a specific color slot in the current palette"""
         if self.current_palette and 0 <= slot_index < len(self.current_palette.colors):
             old_color = self.current_palette.colors[slot_index]
+            if old_color == color:
+                return
             self.current_palette.colors[slot_index] = color
             AppLogger.info(f"Color slot {slot_index} updated: {old_color} -> {color}")
             self._notify_color_change()
@@ -1,6 +1,5 @@
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 import json
-import copy
 import inspect
 from src.models.scene import Scene
 from src.models.effect import Effect
@@ -9,6 +8,15 @@ from src.models.region import Region
 from utils.logger import AppLogger
 
 
+def _copy_json_data(value: Any) -> Any:
+    """Copy JSON-shaped data (dicts, lists, scalars) without deepcopy's memo bookkeeping"""
+    if isinstance(value, dict):
+        return {key: _copy_json_data(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json_data(item) for item in value]
+    return value
+
+
 class DataCacheService:
     """In-memory database cache service with full CRUD operations"""
     
@@ -20,6 +28,21 @@ class DataCacheService:
         self.current_palette_id: Optional[int] = None
         self.is_loaded: bool = False
         self._change_listeners: List[Callable] = []
+        self._sorted_scene_ids: Optional[List[int]] = None
+        self._sorted_region_ids: Optional[List[int]] = None
+        self._palette_colors_cache: Dict[Tuple[int, int], List[str]] = {}
+        self._segment_param_handlers: Dict[str, Callable[[Segment, Any], None]] = {
+            "color": self._set_segment_color,
+            "transparency": self._set_segment_transparency,
+            "length": self._set_segment_length,
+            "move_speed": self._set_segment_move_speed,
+            "move_range": self._set_segment_move_range,
+            "initial_position": self._set_segment_initial_position,
+            "edge_reflect": self._set_segment_edge_reflect,
+            "region_id": self._set_segment_region_id,
+            "solo": self._set_segment_solo,
+            "mute": self._set_segment_mute,
+        }
         
         self._initialize_default_data()
         
@@ -114,13 +137,14 @@ class DataCacheService:
             end=249
         )
         
-    def load_from_json_data(self, json_data: Dict[str, Any]) -> bool:
-        """Load data from JSON structure into cache with auto-fix"""
+    def load_from_json_data(self, json_data: Dict[str, Any], copy_input: bool = True) -> bool:
+        """Load data from JSON structure into cache with auto-fix (copy_input=False fixes unshared data in place)"""
         try:
             self.scenes.clear()
             self.regions.clear()
+            self._invalidate_caches()
             
-            fixed_json_data = self._auto_fix_json_data(json_data)
+            fixed_json_data = self._auto_fix_json_data(json_data, copy_input)
             
             for scene_data in fixed_json_data.get('scenes', []):
                 scene = Scene.from_dict(scene_data)
@@ -141,10 +165,10 @@ class DataCacheService:
         except Exception as e:
             raise Exception(f"Failed to load JSON data: {str(e)}")
             
-    def _auto_fix_json_data(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _auto_fix_json_data(self, json_data: Dict[str, Any], copy_input: bool = True) -> Dict[str, Any]:
         """Auto-fix JSON data to ensure proper array sizes"""
         try:
-            fixed_data = copy.deepcopy(json_data)
+            fixed_data = _copy_json_data(json_data) if copy_input else json_data
             
             for scene_data in fixed_data.get('scenes', []):
                 for effect_data in scene_data.get('effects', []):
@@ -210,6 +234,7 @@ class DataCacheService:
         """Clear all cached data and reinitialize"""
         self.scenes.clear()
         self.regions.clear()
+        self._invalidate_caches()
         self.current_scene_id = None
         self.current_effect_id = None
         self.current_palette_id = None
@@ -226,7 +251,7 @@ class DataCacheService:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 json_data = json.load(f)
-            return self.load_from_json_data(json_data)
+            return self.load_from_json_data(json_data, copy_input=False)
         except Exception as e:
             raise Exception(f"Failed to load file {file_path}: {str(e)}")
             
@@ -245,6 +270,12 @@ class DataCacheService:
 
     # ===== Change Notification =====
     
+    def _invalidate_caches(self):
+        """Drop every value derived from scenes and regions"""
+        self._sorted_scene_ids = None
+        self._sorted_region_ids = None
+        self._palette_colors_cache.clear()
+    
     def add_change_listener(self, callback: Callable):
         """Add listener for cache changes"""
         if callback not in self._change_listeners:
@@ -257,6 +288,7 @@ class DataCacheService:
             
     def _notify_change(self):
         """Notify all listeners about cache changes"""
+        self._invalidate_caches()
         for callback in self._change_listeners[:]:
             try:
                 if callable(callback):
@@ -271,8 +303,10 @@ class DataCacheService:
     # ===== Getters =====
     
     def get_scene_ids(self) -> List[int]:
-        """Get all available scene IDs"""
-        return sorted(self.scenes.keys())
+        """Get all available scene IDs (sorted list cached until next change)"""
+        if self._sorted_scene_ids is None:
+            self._sorted_scene_ids = sorted(self.scenes)
+        return list(self._sorted_scene_ids)
         
     def get_scene(self, scene_id: int) -> Optional[Scene]:
         """Get scene by ID from cache"""
@@ -328,14 +362,18 @@ class DataCacheService:
         return []
         
     def get_palette_colors(self, palette_id: Optional[int] = None, scene_id: Optional[int] = None) -> List[str]:
-        """Get palette colors as hex strings"""
+        """Get palette colors as hex strings (cached until next change)"""
         scene_id = scene_id or self.current_scene_id
         palette_id = palette_id or self.current_palette_id
         
         if scene_id is not None and palette_id is not None:
-            scene = self.get_scene(scene_id)
-            if scene:
-                return scene.get_palette_colors(palette_id)
+            colors = self._palette_colors_cache.get((scene_id, palette_id))
+            if colors is None:
+                scene = self.get_scene(scene_id)
+                if not scene:
+                    return ["#000000"] * 6
+                colors = self._palette_colors_cache[(scene_id, palette_id)] = scene.get_palette_colors(palette_id)
+            return list(colors)
         return ["#000000"] * 6
         
     def get_current_palette_colors(self) -> List[str]:
@@ -343,8 +381,10 @@ class DataCacheService:
         return self.get_palette_colors()
         
     def get_region_ids(self) -> List[int]:
-        """Get all region IDs"""
-        return sorted(self.regions.keys())
+        """Get all region IDs (sorted list cached until next change)"""
+        if self._sorted_region_ids is None:
+            self._sorted_region_ids = sorted(self.regions)
+        return list(self._sorted_region_ids)
         
     def get_region(self, region_id: int) -> Optional[Region]:
         """Get region by ID"""
@@ -380,8 +420,8 @@ class DataCacheService:
         
     def set_current_scene(self, scene_id: int) -> bool:
         """Set current active scene"""
-        if scene_id in self.scenes:
-            scene = self.scenes[scene_id]
+        scene = self.scenes.get(scene_id)
+        if scene is not None:
             self.current_scene_id = scene_id
             self.current_effect_id = scene.current_effect_id
             self.current_palette_id = scene.current_palette_id
@@ -393,7 +433,7 @@ class DataCacheService:
         """Set current active effect"""
         if self.current_scene_id is not None:
             scene = self.get_current_scene()
-            if scene and effect_id in scene.get_effect_ids():
+            if scene and scene.get_effect(effect_id) is not None:
                 self.current_effect_id = effect_id
                 scene.current_effect_id = effect_id
                 self._notify_change()
@@ -415,7 +455,7 @@ class DataCacheService:
         
     def create_new_scene(self, led_count: int, fps: int) -> int:
         """Create new scene in cache and return new scene ID"""
-        new_id = max(self.scenes.keys()) + 1 if self.scenes else 0
+        new_id = max(self.scenes) + 1 if self.scenes else 0
         
         default_palette = [
             [255, 0, 0],     # Red
@@ -426,19 +466,7 @@ class DataCacheService:
             [0, 0, 0]        # Black
         ]
 
-        default_segment = Segment(
-            segment_id=0,
-            color=[0, 1, 2, 3, 4, 5],
-            transparency=[1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
-            length=[10, 10, 10, 10, 10],
-            move_speed=100.0,
-            move_range=[0, led_count],
-            initial_position=0,
-            current_position=0.0,
-            is_edge_reflect=True,
-            region_id=0,
-            dimmer_time=[[1000, 0, 100], [1000, 100, 0]]
-        )
+        default_segment = Segment.create_default(0, led_count)
 
         default_effect = Effect(effect_id=0, segments={"0": default_segment})
         
@@ -468,7 +496,7 @@ class DataCacheService:
         """Duplicate scene in cache and return new scene ID"""
         source_scene = self.get_scene(source_scene_id)
         if source_scene:
-            new_id = max(self.scenes.keys()) + 1 if self.scenes else 0
+            new_id = max(self.scenes) + 1 if self.scenes else 0
             scene_data = source_scene.to_dict()
             scene_data['scene_id'] = new_id
             
@@ -498,8 +526,7 @@ class DataCacheService:
         scene = self.get_scene(scene_id)
         
         if scene:
-            existing_ids = scene.get_effect_ids()
-            new_id = max(existing_ids) + 1 if existing_ids else 0
+            new_id = max((effect.effect_id for effect in scene.effects), default=-1) + 1
             
             new_effect = Effect(effect_id=new_id)
             scene.add_effect(new_effect)
@@ -527,8 +554,7 @@ class DataCacheService:
         source_effect = self.get_effect(scene_id, source_effect_id)
         
         if scene and source_effect:
-            existing_ids = scene.get_effect_ids()
-            new_id = max(existing_ids) + 1 if existing_ids else 0
+            new_id = max((effect.effect_id for effect in scene.effects), default=-1) + 1
             
             effect_data = source_effect.to_dict()
             effect_data['effect_id'] = new_id
@@ -559,19 +585,7 @@ class DataCacheService:
             elif custom_id in existing_ids:
                 return None
 
-            new_segment = Segment(
-                segment_id=custom_id,
-                color=[0, 1, 2, 3, 4, 5],
-                transparency=[1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
-                length=[10, 10, 10, 10, 10],
-                move_speed=100.0,
-                move_range=[0, 250],
-                initial_position=0,
-                current_position=0.0,
-                is_edge_reflect=True,
-                region_id=0,
-                dimmer_time=[[1000, 0, 100], [1000, 100, 0]]
-            )
+            new_segment = Segment.create_default(custom_id)
 
             effect.add_segment(new_segment)
             self._notify_change()
@@ -609,6 +623,86 @@ class DataCacheService:
             return new_id
         return None
         
+    def _set_segment_color(self, segment: Segment, value: Any):
+        """Apply color update (single slot dict or full list) to segment"""
+        if isinstance(value, dict) and "index" in value and "color_index" in value:
+            index = value["index"]
+            color_index = value["color_index"]
+            if index >= 0:
+                if index >= len(segment.color):
+                    segment.color.extend([0] * (index + 1 - len(segment.color)))
+                    if index >= len(segment.transparency):
+                        segment.transparency.extend([1.0] * (index + 1 - len(segment.transparency)))
+                    expected_len = len(segment.color) - 1
+                    if len(segment.length) < expected_len:
+                        segment.length.extend([10] * (expected_len - len(segment.length)))
+                segment.color[index] = color_index
+        elif isinstance(value, list):
+            segment.color = value
+
+    def _set_segment_transparency(self, segment: Segment, value: Any):
+        """Apply transparency update (single slot dict or full list) to segment"""
+        if isinstance(value, dict) and "index" in value and "transparency" in value:
+            index = value["index"]
+            transparency = value["transparency"]
+            if index >= 0:
+                if index >= len(segment.transparency):
+                    segment.transparency.extend([1.0] * (index + 1 - len(segment.transparency)))
+                if index >= len(segment.color):
+                    segment.color.extend([0] * (index + 1 - len(segment.color)))
+                expected_len = len(segment.color) - 1
+                if len(segment.length) < expected_len:
+                    segment.length.extend([10] * (expected_len - len(segment.length)))
+                segment.transparency[index] = transparency
+        elif isinstance(value, list):
+            segment.transparency = value
+
+    def _set_segment_length(self, segment: Segment, value: Any):
+        """Apply length update (single slot dict or full list) to segment"""
+        if isinstance(value, dict) and "index" in value and "length" in value:
+            index = value["index"]
+            length = value["length"]
+            if index >= 0:
+                if index >= len(segment.length):
+                    segment.length.extend([10] * (index + 1 - len(segment.length)))
+                required_colors = index + 2
+                if len(segment.color) < required_colors:
+                    add = required_colors - len(segment.color)
+                    segment.color.extend([0] * add)
+                    segment.transparency.extend([1.0] * add)
+                segment.length[index] = length
+        elif isinstance(value, list):
+            segment.length = value
+
+    def _set_segment_move_range(self, segment: Segment, value: Any):
+        """Apply move range update when value is a [start, end] pair"""
+        if isinstance(value, list) and len(value) == 2:
+            segment.move_range = value
+
+    def _set_segment_move_speed(self, segment: Segment, value: Any):
+        """Apply move speed update"""
+        segment.move_speed = float(value)
+
+    def _set_segment_initial_position(self, segment: Segment, value: Any):
+        """Apply initial position update"""
+        segment.initial_position = int(value)
+
+    def _set_segment_edge_reflect(self, segment: Segment, value: Any):
+        """Apply edge reflect flag update"""
+        segment.is_edge_reflect = bool(value)
+
+    def _set_segment_region_id(self, segment: Segment, value: Any):
+        """Apply region assignment update"""
+        segment.region_id = int(value)
+
+    def _set_segment_solo(self, segment: Segment, value: Any):
+        """Apply solo flag update"""
+        segment.is_solo = bool(value)
+
+    def _set_segment_mute(self, segment: Segment, value: Any):
+        """Apply mute flag update"""
+        segment.is_mute = bool(value)
+
     def update_segment_parameter(self, segment_id: str, param: str, value: Any, scene_id: Optional[int] = None, effect_id: Optional[int] = None) -> bool:
         """Update segment parameter in cache"""
         segment = self.get_segment(segment_id, scene_id, effect_id)
@@ -625,69 +719,9 @@ class DataCacheService:
                         return True
                     return False
 
-                if param == "color":
-                    if isinstance(value, dict) and "index" in value and "color_index" in value:
-                        index = value["index"]
-                        color_index = value["color_index"]
-                        if index >= 0:
-                            if index >= len(segment.color):
-                                segment.color.extend([0] * (index + 1 - len(segment.color)))
-                                if index >= len(segment.transparency):
-                                    segment.transparency.extend([1.0] * (index + 1 - len(segment.transparency)))
-                                expected_len = len(segment.color) - 1
-                                if len(segment.length) < expected_len:
-                                    segment.length.extend([10] * (expected_len - len(segment.length)))
-                            segment.color[index] = color_index
-                    elif isinstance(value, list):
-                        segment.color = value
-
-                elif param == "transparency":
-                    if isinstance(value, dict) and "index" in value and "transparency" in value:
-                        index = value["index"]
-                        transparency = value["transparency"]
-                        if index >= 0:
-                            if index >= len(segment.transparency):
-                                segment.transparency.extend([1.0] * (index + 1 - len(segment.transparency)))
-                            if index >= len(segment.color):
-                                segment.color.extend([0] * (index + 1 - len(segment.color)))
-                            expected_len = len(segment.color) - 1
-                            if len(segment.length) < expected_len:
-                                segment.length.extend([10] * (expected_len - len(segment.length)))
-                            segment.transparency[index] = transparency
-                    elif isinstance(value, list):
-                        segment.transparency = value
-
-                elif param == "length":
-                    if isinstance(value, dict) and "index" in value and "length" in value:
-                        index = value["index"]
-                        length = value["length"]
-                        if index >= 0:
-                            if index >= len(segment.length):
-                                segment.length.extend([10] * (index + 1 - len(segment.length)))
-                            required_colors = index + 2
-                            if len(segment.color) < required_colors:
-                                add = required_colors - len(segment.color)
-                                segment.color.extend([0] * add)
-                                segment.transparency.extend([1.0] * add)
-                            segment.length[index] = length
-                    elif isinstance(value, list):
-                        segment.length = value
-                        
-                elif param == "move_speed":
-                    segment.move_speed = float(value)
-                elif param == "move_range":
-                    if isinstance(value, list) and len(value) == 2:
-                        segment.move_range = value
-                elif param == "initial_position":
-                    segment.initial_position = int(value)
-                elif param == "edge_reflect":
-                    segment.is_edge_reflect = bool(value)
-                elif param == "region_id":
-                    segment.region_id = int(value)
-                elif param == "solo":
-                    segment.is_solo = bool(value)
-                elif param == "mute":
-                    segment.is_mute = bool(value)
+                handler = self._segment_param_handlers.get(param)
+                if handler:
+                    handler(segment, value)
                 else:
                     setattr(segment, param, value)
                     
@@ -746,7 +780,7 @@ class DataCacheService:
         
         if scene and 0 <= source_palette_id < len(scene.palettes):
             source_palette = scene.palettes[source_palette_id]
-            new_palette = copy.deepcopy(source_palette)
+            new_palette = [list(color) for color in source_palette]
             
             scene.palettes.append(new_palette)
             new_id = len(scene.palettes) - 1
@@ -764,6 +798,8 @@ class DataCacheService:
             try:
                 hex_color = color.lstrip('#')
                 r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+                if scene.palettes[palette_id][color_index] == [r, g, b]:
+                    return True
                 scene.palettes[palette_id][color_index] = [r, g, b]
                 self._notify_change()
                 return True
@@ -775,7 +811,7 @@ class DataCacheService:
         
     def create_new_region(self, start: int, end: int, name: str = None) -> int:
         """Create new region and return new region ID"""
-        new_id = max(self.regions.keys()) + 1 if self.regions else 0
+        new_id = max(self.regions) + 1 if self.regions else 0
         
         region = Region(
             region_id=new_id,
@@ -800,7 +836,7 @@ class DataCacheService:
         """Duplicate region and return new region ID"""
         source_region = self.get_region(source_region_id)
         if source_region:
-            new_id = max(self.regions.keys()) + 1 if self.regions else 0
+            new_id = max(self.regions) + 1 if self.regions else 0
             
             new_region = Region(
                 region_id=new_id,
@@ -831,7 +867,7 @@ class DataCacheService:
         
         if scene and 0 <= source_palette_id < len(scene.palettes):
             source_palette = scene.palettes[source_palette_id]
-            new_palette = copy.deepcopy(source_palette)
+            new_palette = [list(color) for color in source_palette]
             
             scene.palettes.append(new_palette)
             new_id = len(scene.palettes) - 1
@@ -849,6 +885,8 @@ class DataCacheService:
             try:
                 hex_color = color.lstrip('#')
                 r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+                if scene.palettes[palette_id][color_index] == [r, g, b]:
+                    return True
                 scene.palettes[palette_id][color_index] = [r, g, b]
                 self._notify_change()
                 return True
@@ -860,7 +898,7 @@ class DataCacheService:
         
     def create_new_region(self, start: int, end: int, name: str = None) -> int:
         """Create new region and return new region ID"""
-        new_id = max(self.regions.keys()) + 1 if self.regions else 0
+        new_id = max(self.regions) + 1 if self.regions else 0
         
         region = Region(
             region_id=new_id,
@@ -885,7 +923,7 @@ class DataCacheService:
         """Duplicate region and return new region ID"""
         source_region = self.get_region(source_region_id)
         if source_region:
-            new_id = max(self.regions.keys()) + 1 if self.regions else 0
+            new_id = max(self.regions) + 1 if self.regions else 0
             
             new_region = Region(
                 region_id=new_id,
@@ -45,7 +45,7 @@ class FileService:
             with open(file_path, 'r', encoding='utf-8') as f:
                 json_data = json.load(f)
                 
-            if self.data_cache.load_from_json_data(json_data):
+            if self.data_cache.load_from_json_data(json_data, copy_input=False):
                 self.current_file_path = file_path
                 self.has_changes = False
                 self._add_to_recent_files(file_path)
@@ -75,10 +75,7 @@ class FileService:
             return
             
         try:
-            data = self.data_cache.export_to_dict()
-            
-            with open(self.current_file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._write_json_file(self.current_file_path)
                 
             self.has_changes = False
             
@@ -103,10 +100,7 @@ class FileService:
             file_path += '.json'
             
         try:
-            data = self.data_cache.export_to_dict()
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._write_json_file(file_path)
                 
             self.current_file_path = file_path
             self.has_changes = False
@@ -122,6 +116,13 @@ class FileService:
                 self.on_file_saved(file_path, False, error_msg)
             return False
                 
+    def _write_json_file(self, file_path: str):
+        """Serialize cache data to a string and write it with a single call"""
+        content = json.dumps(self.data_cache.export_to_dict(), indent=2, ensure_ascii=False)
+        
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+                
     def open_file_by_path(self, file_path: str):
         """Open specific file by path"""
         return self.load_file_from_path(file_path)
@@ -1,6 +1,6 @@
-from pythonosc import udp_client
+from pythonosc import udp_client, osc_bundle_builder, osc_message_builder
 from pythonosc.dispatcher import Dispatcher
-from pythonosc.osc.osc_server import BlockingOSCUDPServer
+from pythonosc.osc_server import BlockingOSCUDPServer
 from threading import Thread
 import inspect
 from typing import Optional, Dict, Any, Callable, List, Tuple
@@ -45,6 +45,9 @@ class OSCRegistry:
 
 _osc_registry = OSCRegistry()
 
+MAX_BUNDLE_SIZE = 1400
+BUNDLE_HEADER_SIZE = 16
+
 
 class OSCService:
     """Enhanced OSC service với auto-registration và smart routing"""
@@ -86,7 +89,8 @@ class OSCService:
             
         target_key = f"{target[0]}:{target[1]}"
         
-        if target_key not in self.connection_pools:
+        client = self.connection_pools.get(target_key)
+        if client is None:
             try:
                 client = udp_client.SimpleUDPClient(target[0], target[1])
                 self.connection_pools[target_key] = client
@@ -95,7 +99,7 @@ class OSCService:
                 AppLogger.error(f"Failed to create OSC client for {target_key}: {e}")
                 raise
                 
-        return self.connection_pools[target_key]
+        return client
             
     def start_client(self) -> bool:
         """Start OSC client for sending messages"""
@@ -172,6 +176,47 @@ class OSCService:
             AppLogger.error(f"Failed to send OSC message {address}: {e}")
             return False
             
+    def _send_bundle(self, messages: List[Tuple[str, tuple]], target: Tuple[str, int] = None) -> bool:
+        """Send several messages as OSC bundles, splitting so each UDP datagram stays under MAX_BUNDLE_SIZE"""
+        try:
+            built_messages = []
+            for address, args in messages:
+                cmd = _osc_registry.commands.get(address)
+                if cmd and not self._validate_params(cmd, args):
+                    AppLogger.warning(f"Invalid parameters for {address}: {args}")
+                    return False
+                
+                msg = osc_message_builder.OscMessageBuilder(address=address)
+                for arg in args:
+                    msg.add_arg(arg)
+                built_messages.append(msg.build())
+            
+            client = self.get_client(target)
+            bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+            bundle_size = BUNDLE_HEADER_SIZE
+            bundle_count = 0
+            
+            for msg in built_messages:
+                element_size = 4 + msg.size
+                if bundle_count and bundle_size + element_size > MAX_BUNDLE_SIZE:
+                    client.send(bundle.build())
+                    bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+                    bundle_size = BUNDLE_HEADER_SIZE
+                    bundle_count = 0
+                bundle.add_content(msg)
+                bundle_size += element_size
+                bundle_count += 1
+            
+            if bundle_count:
+                client.send(bundle.build())
+            
+            AppLogger.info(f"OSC sent bundle: {len(messages)} messages")
+            return True
+            
+        except Exception as e:
+            AppLogger.error(f"Failed to send OSC bundle: {e}")
+            return False
+            
     def _validate_params(self, cmd: OSCCommand, args: tuple) -> bool:
         """Validate parameters against registered command"""
         if len(args) != len(cmd.param_types):
@@ -368,10 +413,10 @@ class OSCService:
         
     def send_dissolve_commands(self, file_path: str, pattern_id: int) -> bool:
         """Send dissolve pattern commands"""
-        load_success = self._send_message("/load_dissolve_json", file_path)
-        if load_success:
-            return self._send_message("/set_dissolve_pattern", pattern_id)
-        return False
+        return self._send_bundle([
+            ("/load_dissolve_json", (file_path,)),
+            ("/set_dissolve_pattern", (pattern_id,)),
+        ])
     
     # ===== Response Handlers =====
         
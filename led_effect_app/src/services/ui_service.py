@@ -55,8 +55,9 @@ class UIService:
                 
     def _notify_state_change(self, component_id: str, state_key: str, value: Any):
         """Notify callbacks about state changes"""
-        if component_id in self.update_callbacks:
-            for callback in self.update_callbacks[component_id][:]:
+        callbacks = self.update_callbacks.get(component_id)
+        if callbacks:
+            for callback in callbacks[:]:
                 try:
                     callback(state_key, value)
                 except Exception as e:
@@ -27,6 +27,10 @@ class TerminalLogger:
         )
         self.logger = logging.getLogger(__name__)
     
+    def debug(self, message: str):
+        """Log debug message to terminal"""
+        self.logger.debug(message)
+    
     def info(self, message: str):
         """Log info message to terminal"""
         self.logger.info(message)
@@ -61,6 +65,11 @@ class AppLogger:
             cls.initialize()
         return cls._terminal_logger
     
+    @classmethod
+    def debug(cls, message: str):
+        """Log debug message to terminal"""
+        cls.get_logger().debug(message)
+    
     @classmethod
     def info(cls, message: str):
         """Log info message to terminal"""
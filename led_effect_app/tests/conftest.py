@@ -0,0 +1,18 @@
+import pytest
+
+
+class DeferredPage:
+    """Page stub that queues run_task handlers so tests decide when they run"""
+
+    def __init__(self):
+        self.overlay = []
+        self.tasks = []
+    def run_task(self, handler):
+        self.tasks.append(handler)
+    def update(self):
+        pass
+
+
+@pytest.fixture
+def deferred_page():
+    return DeferredPage()
@@ -18,6 +18,18 @@ def test_update_segment_id_preserves_data():
     assert updated.color[0] == 5
 
 
+def test_update_segment_parameter_dispatches_by_name():
+    dc = DataCacheService()
+    assert dc.update_segment_parameter("0", "move_speed", "12.5")
+    assert dc.update_segment_parameter("0", "solo", 1)
+    assert dc.update_segment_parameter("0", "color", {"index": 7, "color_index": 3})
+    segment = dc.get_segment("0")
+    assert segment.move_speed == 12.5
+    assert segment.is_solo is True
+    assert segment.color[7] == 3
+    assert len(segment.length) == len(segment.color) - 1
+
+
 def test_create_new_scene_has_default_palette_and_segment():
     dc = DataCacheService()
     new_scene_id = dc.create_new_scene(led_count=100, fps=60)
@@ -26,6 +38,41 @@ def test_create_new_scene_has_default_palette_and_segment():
     effect = scene.get_effect(0)
     segment = effect.get_segment("0")
     assert segment.color == [0,1,2,3,4,5]
+    assert segment.move_range == [0, 100]
+
+
+def test_new_segments_do_not_share_default_lists():
+    dc = DataCacheService()
+    first_id = dc.create_new_segment()
+    second_id = dc.create_new_segment()
+    first = dc.get_segment(str(first_id))
+    second = dc.get_segment(str(second_id))
+    first.color[0] = 5
+    first.dimmer_time[0][0] = 50
+    assert second.color[0] == 0
+    assert second.dimmer_time[0][0] == 1000
+
+
+def test_duplicate_palette_is_independent_of_source():
+    dc = DataCacheService()
+    new_id = dc.duplicate_palette(0)
+    assert dc.update_palette_color(new_id, 0, "#010203")
+    scene = dc.get_current_scene()
+    assert scene.palettes[new_id][0] == [1, 2, 3]
+    assert scene.palettes[0][0] == [255, 0, 0]
+    copy_id = dc.duplicate_palette(0)
+    scene.palettes[copy_id][0][0] = 1
+    assert scene.palettes[0][0] == [255, 0, 0]
+
+
+def test_update_palette_color_skips_notify_when_unchanged():
+    dc = DataCacheService()
+    notified = []
+    dc.add_change_listener(lambda: notified.append(True))
+    assert dc.update_palette_color(0, 0, "#FF0000")
+    assert notified == []
+    assert dc.update_palette_color(0, 0, "#00FF00")
+    assert notified == [True]
 
 
 def test_delete_palette_resets_segment_colors():
@@ -51,3 +98,65 @@ def test_load_json_defaults_missing_region_id_to_zero():
 
     exported = new_dc.export_to_dict()
     assert exported['scenes'][0]['effects'][0]['segments']['0']['region_id'] == 0
+
+
+def test_scene_ids_refresh_after_scene_changes():
+    dc = DataCacheService()
+    assert dc.get_scene_ids() == [0]
+    new_scene_id = dc.create_new_scene(led_count=100, fps=60)
+    assert dc.get_scene_ids() == [0, new_scene_id]
+    dc.get_scene_ids().append(99)
+    assert dc.get_scene_ids() == [0, new_scene_id]
+    assert dc.delete_scene(new_scene_id)
+    assert dc.get_scene_ids() == [0]
+
+
+def test_region_ids_refresh_after_region_changes():
+    dc = DataCacheService()
+    region_ids = dc.get_region_ids()
+    new_region_id = dc.create_new_region(0, 10)
+    assert dc.get_region_ids() == region_ids + [new_region_id]
+    dc.get_region_ids().append(99)
+    assert dc.get_region_ids() == region_ids + [new_region_id]
+    assert dc.delete_region(new_region_id)
+    assert dc.get_region_ids() == region_ids
+
+
+def test_load_json_data_copies_input_by_default():
+    data = DataCacheService().export_to_dict()
+    dc = DataCacheService()
+    assert dc.load_from_json_data(data)
+    data['scenes'][0]['palettes'][0][0][0] = 7
+    data['scenes'][0]['effects'][0]['segments']['0']['color'][0] = 3
+    scene = dc.get_scene(0)
+    assert scene.palettes[0][0][0] == 255
+    assert scene.get_effect(0).get_segment("0").color[0] == 0
+
+
+def test_palette_colors_cache_refreshes_after_update():
+    dc = DataCacheService()
+    colors = dc.get_palette_colors(0, 0)
+    colors[0] = "#123456"
+    assert dc.get_palette_colors(0, 0)[0] == "#FF0000"
+    assert dc.update_palette_color(0, 0, "#010203")
+    assert dc.get_palette_colors(0, 0)[0] == "#010203"
+
+
+def test_palette_colors_cache_cleared_when_load_fails():
+    dc = DataCacheService()
+    assert dc.get_palette_colors(0, 0)[0] == "#FF0000"
+    data = dc.export_to_dict()
+    data['scenes'][0]['led_count'] = 0
+    with pytest.raises(Exception):
+        dc.load_from_json_data(data)
+    assert dc.get_palette_colors(0, 0) == ["#000000"] * 6
+
+
+def test_effect_lookup_tracks_added_and_removed_effects():
+    dc = DataCacheService()
+    scene = dc.get_current_scene()
+    assert scene.get_effect(0) is not None
+    new_id = dc.create_new_effect()
+    assert scene.get_effect(new_id).effect_id == new_id
+    assert dc.delete_effect(new_id)
+    assert scene.get_effect(new_id) is None
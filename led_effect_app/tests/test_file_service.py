@@ -37,3 +37,13 @@ def test_data_change_marks_dirty():
     assert not fs.has_unsaved_changes()
     dc.update_scene_settings(0, 300, None)
     assert fs.has_unsaved_changes()
+
+
+def test_failed_serialization_keeps_existing_file(tmp_path):
+    dc = DataCacheService()
+    fs = FileService(dc)
+    target = tmp_path / "scene_keep.json"
+    target.write_text('{"scenes": []}', encoding='utf-8')
+    dc.export_to_dict = lambda: {"scenes": [object()]}
+    assert not fs.save_to_path(str(target))
+    assert target.read_text(encoding='utf-8') == '{"scenes": []}'
@@ -0,0 +1,55 @@
+import os
+import sys
+
+from pythonosc.osc_bundle import OscBundle
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services.osc_service import OSCService, MAX_BUNDLE_SIZE, BUNDLE_HEADER_SIZE
+
+
+class RecordingClient:
+    """Stand-in UDP client that records sent datagrams"""
+
+    def __init__(self):
+        self.datagrams = []
+
+    def send(self, content):
+        self.datagrams.append(content.dgram)
+
+
+def make_service():
+    service = OSCService()
+    client = RecordingClient()
+    service.connection_pools["%s:%s" % service.default_target] = client
+    return service, client
+
+
+def test_send_bundle_splits_into_datagrams_under_max_size():
+    service, client = make_service()
+    messages = [(f"/test/segment/{i}", (i, "x" * 20)) for i in range(100)]
+
+    assert service._send_bundle(messages)
+
+    assert len(client.datagrams) > 1
+    received = []
+    for dgram in client.datagrams:
+        assert len(dgram) <= MAX_BUNDLE_SIZE
+        bundle = OscBundle(dgram)
+        element_sizes = sum(4 + len(msg.dgram) for msg in bundle)
+        assert len(dgram) == BUNDLE_HEADER_SIZE + element_sizes
+        received.extend((msg.address, tuple(msg.params)) for msg in bundle)
+    assert received == messages
+
+
+def test_send_dissolve_commands_sends_one_ordered_bundle():
+    service, client = make_service()
+
+    assert service.send_dissolve_commands("patterns.json", 2)
+
+    assert len(client.datagrams) == 1
+    bundle = OscBundle(client.datagrams[0])
+    assert [(msg.address, msg.params) for msg in bundle] == [
+        ("/load_dissolve_json", ["patterns.json"]),
+        ("/set_dissolve_pattern", [2]),
+    ]
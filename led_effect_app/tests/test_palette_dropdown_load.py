@@ -48,3 +48,14 @@ def test_palette_dropdown_updated_on_load():
     assert len(panel.color_palette.palette_dropdown.options) == 2
     assert panel.color_palette.palette_dropdown.value == "1"
     data_cache.clear()
+
+
+def test_cache_change_burst_schedules_single_ui_update(deferred_page):
+    handler = DataActionHandler(deferred_page)
+    for _ in range(5):
+        handler._on_cache_changed()
+    assert len(deferred_page.tasks) == 1
+
+    asyncio.run(deferred_page.tasks.pop()())
+    handler._on_cache_changed()
+    assert len(deferred_page.tasks) == 1
@@ -20,3 +20,17 @@ def test_palette_sync_after_scene_creation():
 
     # After new scene, palette should sync with cache default (first color red)
     assert color_service.get_palette_colors()[0] == "#FF0000"
+
+
+def test_unchanged_palette_color_does_not_notify():
+    calls = []
+    listener = lambda: calls.append(1)
+    color_service.add_color_change_listener(listener)
+    try:
+        current = color_service.get_palette_colors()[1]
+        color_service.update_palette_color(1, current)
+        assert calls == []
+        color_service.update_palette_color(1, "#123456")
+        assert calls == [1]
+    finally:
+        color_service.remove_color_change_listener(listener)
@@ -0,0 +1,28 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from components.ui.toast import ToastManager
+
+
+def test_identical_toasts_are_coalesced_while_scheduled(deferred_page):
+    manager = ToastManager(deferred_page)
+    shown = []
+
+    async def fake_show(message, duration):
+        shown.append(message)
+
+    manager.show_error = fake_show
+    for _ in range(5):
+        manager.show_error_sync("Palette update failed")
+    manager.show_error_sync("Other failure")
+    assert len(deferred_page.tasks) == 2
+
+    while deferred_page.tasks:
+        asyncio.run(deferred_page.tasks.pop(0)())
+    assert shown == ["Palette update failed", "Other failure"]
+
+    manager.show_error_sync("Palette update failed")
+    assert len(deferred_page.tasks) == 1